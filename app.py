@@ -9,14 +9,10 @@ Author: Nchoolwe Progress Sinampande
 import os
 import streamlit as st
 
-from components.sankey_diagram import create_sankey
-from components.map_visualization import create_cluster_map, create_heatmap
-from components.indicator_cards import render_metric_row, render_target_bar
-from components.filters import render_sidebar_filters, apply_filters, render_active_filters
-from components.charts import (
-    funnel_chart, pathway_distribution, status_distribution,
-    shelter_distribution, documentation_distribution, trend_chart,
-    stage_composition,
+from components.indicator_cards import render_metric_row, render_target_bars
+from components.filters import (
+    render_sidebar_filters, apply_filters, render_active_filters,
+    build_filter_options,
 )
 from utils.data_processing import (
     load_and_process_data, calculate_kpis, get_monthly_trends,
@@ -24,7 +20,9 @@ from utils.data_processing import (
 )
 from utils.theme import PRIMARY, STATUS_COLORS, STAGE_COLORS, PATHWAY_COLORS
 
-from streamlit_folium import st_folium
+# The chart/map components (and their plotly / folium / streamlit-folium
+# imports) are deliberately imported inside the tab fragments below, so a
+# cold start only pays for what the first-rendered tab actually uses.
 
 st.set_page_config(
     page_title="Beneficiary Solutions Dashboard",
@@ -49,19 +47,230 @@ def load_data():
     return load_and_process_data(path)
 
 
+@st.cache_data
+def filter_options(_df):
+    """Sidebar option lists, computed once per loaded dataset."""
+    return build_filter_options(_df)
+
+
+def filters_key(filters: dict) -> tuple:
+    """Hashable fingerprint of the sidebar selections, used as a cache key."""
+    return tuple(sorted(filters.items(), key=str))
+
+
+@st.cache_data
+def filter_data(_df, fkey: tuple):
+    """Apply the sidebar filters once per unique selection.
+
+    The frame is passed underscore-prefixed so Streamlit keys the cache on
+    the (tiny) filters tuple instead of rehashing the whole DataFrame on
+    every rerun — tab switches and widget nudges that leave the filters
+    untouched then skip the filtering entirely.
+    """
+    return apply_filters(_df, dict(fkey))
+
+
+@st.cache_data
+def build_figure(name: str, fkey: tuple, _builder, _df, **kwargs):
+    """Build (or reuse) a chart figure for the current selection.
+
+    Cached on (name, filters key, kwargs); the builder and the frame are
+    passed underscore-prefixed so nothing heavy is hashed. Reruns with
+    unchanged filters reuse the already-built figure instead of
+    recomputing and re-serializing it.
+    """
+    return _builder(_df, **kwargs)
+
+
+@st.cache_data
+def build_sankey(_fdf, fkey: tuple):
+    """Sankey figure for the current selection, cached on the filters key.
+
+    Crosstabbing three columns into node/link arrays is the most expensive
+    figure build on the overview tab; unchanged filters reuse the cached
+    figure without rehashing the frame.
+    """
+    from components.sankey_diagram import create_sankey
+    return create_sankey(_fdf, "displacement_status", "solutions_pathway", "pathway_stage")
+
+
+def derived_outputs(fdf, fkey: tuple) -> dict:
+    """KPIs and derived tables for the current filter selection.
+
+    Keyed on the filters fingerprint in session_state rather than
+    st.cache_data, so reruns that leave the filters untouched reuse the
+    previous results without hashing anything at all.
+    """
+    if st.session_state.get("_derived_fkey") != fkey:
+        st.session_state["_derived_fkey"] = fkey
+        st.session_state["_derived"] = {
+            "kpis": calculate_kpis(fdf),
+            "monthly": get_monthly_trends(fdf),
+            "regional": get_regional_summary(fdf),
+        }
+    return st.session_state["_derived"]
+
+
 def section(title: str, sub: str = "") -> None:
     """Render a quiet section heading."""
     sub_html = f'<div class="section-sub">{sub}</div>' if sub else '<div style="height:12px"></div>'
     st.markdown(f'<div class="section-title">{title}</div>{sub_html}', unsafe_allow_html=True)
 
 
+@st.fragment
+def render_overview(fdf, fkey):
+    """Overview tab: funnel, pathway/status breakdowns and the Sankey flow."""
+    from components.charts import funnel_chart, pathway_distribution, status_distribution
+
+    st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
+    left, right = st.columns([1.05, 1], gap="large")
+    with left:
+        section("Beneficiaries by stage", "Progress funnel across the caseload")
+        st.plotly_chart(build_figure("funnel", fkey, funnel_chart, fdf),
+                        width="stretch", config=PLOTLY_CONFIG)
+    with right:
+        section("By solutions pathway", "Return · Local Integration · Relocation")
+        st.plotly_chart(build_figure("pathway", fkey, pathway_distribution, fdf),
+                        width="stretch", config=PLOTLY_CONFIG)
+        st.markdown("<div style='height:6px'></div>", unsafe_allow_html=True)
+        section("By displacement status", "")
+        st.plotly_chart(build_figure("status", fkey, status_distribution, fdf),
+                        width="stretch", config=PLOTLY_CONFIG)
+
+    st.markdown("<div style='height:18px'></div>", unsafe_allow_html=True)
+    section("Flow to durable solutions",
+            "Displacement status → solutions pathway → pathway stage")
+    st.plotly_chart(build_sankey(fdf, fkey), width="stretch", config=PLOTLY_CONFIG)
+
+
+@st.fragment
+def render_geography(fdf, regional):
+    """Geography tab: cluster/heat map and the regional summary table."""
+    from components.map_visualization import create_cluster_map, create_heatmap
+    from streamlit_folium import st_folium
+
+    st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
+    section("Geographic distribution", "Each point is a registered household")
+
+    ctrl1, ctrl2, _ = st.columns([1.4, 1.4, 3])
+    with ctrl1:
+        color_by = st.selectbox(
+            "Colour by",
+            ["solutions_pathway", "displacement_status", "pathway_stage"],
+            format_func=lambda x: x.replace("_", " ").title(),
+        )
+    with ctrl2:
+        map_type = st.selectbox("Map type", ["Clusters", "Heatmap"])
+
+    if map_type == "Clusters":
+        m = create_cluster_map(fdf, color_by=color_by, zoom_start=6)
+    else:
+        m = create_heatmap(fdf, weight_col="household_size", zoom_start=6)
+    st_folium(m, height=500, use_container_width=True, returned_objects=[])
+
+    st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
+    section("Regional summary", "")
+    summary = regional.rename(columns={
+        "region": "Region", "beneficiaries": "Beneficiaries", "individuals": "Individuals",
+        "achieved": "Achieved", "livelihood_support": "Livelihood",
+        "achievement_rate": "Achievement %", "female_hoh_rate": "Female HoH %",
+    })[["Region", "Beneficiaries", "Individuals", "Achieved",
+        "Livelihood", "Achievement %", "Female HoH %"]]
+    # Plain dataframe + column_config instead of a pandas Styler: the styled
+    # HTML path re-renders the whole table through the Styler on every rerun,
+    # while column_config formats client-side. The progress column keeps the
+    # at-a-glance cue the green gradient used to provide.
+    st.dataframe(
+        summary,
+        width="stretch", hide_index=True,
+        column_config={
+            "Beneficiaries": st.column_config.NumberColumn(format="localized"),
+            "Individuals": st.column_config.NumberColumn(format="localized"),
+            "Achieved": st.column_config.NumberColumn(format="localized"),
+            "Livelihood": st.column_config.NumberColumn(format="localized"),
+            "Achievement %": st.column_config.ProgressColumn(
+                format="%.1f%%", min_value=0, max_value=100),
+            "Female HoH %": st.column_config.NumberColumn(format="%.1f%%"),
+        },
+    )
+
+
+@st.fragment
+def render_progress(fdf, kpis, df, monthly, fkey):
+    """Progress tab: trends, stage composition and targets."""
+    from components.charts import (
+        trend_chart, stage_composition, shelter_distribution,
+        documentation_distribution,
+    )
+
+    st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
+    section("Registrations over time", "Monthly intake and cumulative reach")
+    st.plotly_chart(build_figure("trend", fkey, trend_chart, monthly),
+                    width="stretch", config=PLOTLY_CONFIG)
+
+    st.markdown("<div style='height:18px'></div>", unsafe_allow_html=True)
+    c1, c2 = st.columns(2, gap="large")
+    with c1:
+        section("Stage by region", "")
+        st.plotly_chart(build_figure("stage_mix", fkey, stage_composition, fdf, by="region"),
+                        width="stretch", config=PLOTLY_CONFIG)
+    with c2:
+        section("Stage by pathway", "")
+        st.plotly_chart(build_figure("stage_mix", fkey, stage_composition, fdf, by="solutions_pathway"),
+                        width="stretch", config=PLOTLY_CONFIG)
+
+    st.markdown("<div style='height:18px'></div>", unsafe_allow_html=True)
+    c3, c4 = st.columns(2, gap="large")
+    with c3:
+        section("Shelter status", "")
+        st.plotly_chart(build_figure("shelter", fkey, shelter_distribution, fdf),
+                        width="stretch", config=PLOTLY_CONFIG)
+    with c4:
+        section("Documentation status", "")
+        st.plotly_chart(build_figure("documentation", fkey, documentation_distribution, fdf),
+                        width="stretch", config=PLOTLY_CONFIG)
+
+    st.markdown("<div style='height:22px'></div>", unsafe_allow_html=True)
+    section("Progress against targets", "Programme planning goals, not derived from actuals")
+
+    total = kpis["total_beneficiaries"]
+    tcol1, tcol2 = st.columns(2, gap="large")
+    with tcol1:
+        st.markdown("**Effectiveness**")
+        render_target_bars([
+            {"label": "Solutions achieved (35%)", "current": kpis["solutions_achieved"],
+             "target": round(total * 0.35), "accent": "#059669"},
+            {"label": "Livelihood support (60%)", "current": kpis["livelihood_support_count"],
+             "target": round(total * 0.60), "accent": "#3B82F6"},
+            {"label": "Complete documentation (75%)", "current": kpis["complete_documentation"],
+             "target": round(total * 0.75), "accent": "#8B5CF6"},
+            {"label": "Permanent shelter (45%)", "current": kpis["permanent_shelter"],
+             "target": round(total * 0.45), "accent": "#14B8A6"},
+        ])
+    with tcol2:
+        st.markdown("**Coverage**")
+        render_target_bars([
+            {"label": "Total beneficiaries reached", "current": kpis["total_beneficiaries"],
+             "target": 600, "accent": PRIMARY},
+            {"label": "Female-headed households (40%)",
+             "current": kpis["female_hoh_percentage"] * 100, "target": 40,
+             "accent": "#8B5CF6", "unit": "%"},
+            {"label": "Regions covered", "current": kpis["regions_covered"],
+             "target": df["region"].nunique(), "accent": "#F59E0B"},
+            {"label": "Districts covered", "current": kpis["districts_covered"],
+             "target": df["district"].nunique(), "accent": "#3B82F6"},
+        ])
+
+
 def main():
     load_css()
     df = load_data()
 
-    filters = render_sidebar_filters(df)
-    fdf = apply_filters(df, filters)
-    kpis = calculate_kpis(fdf) if len(fdf) else None
+    filters = render_sidebar_filters(df, options=filter_options(df))
+    fkey = filters_key(filters)
+    fdf = filter_data(df, fkey)
+    derived = derived_outputs(fdf, fkey) if len(fdf) else None
+    kpis = derived["kpis"] if derived else None
 
     # ---- Header ----
     st.markdown(
@@ -98,115 +307,14 @@ def main():
 
     tab_overview, tab_geo, tab_progress = st.tabs(["Overview", "Geography", "Progress"])
 
-    # ==================== OVERVIEW ====================
+    # Each tab body is an st.fragment, so widgets inside one tab (map type,
+    # colour-by, ...) rerun only that tab instead of the whole page.
     with tab_overview:
-        st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
-        left, right = st.columns([1.05, 1], gap="large")
-        with left:
-            section("Beneficiaries by stage", "Progress funnel across the caseload")
-            st.plotly_chart(funnel_chart(fdf), width="stretch", config=PLOTLY_CONFIG)
-        with right:
-            section("By solutions pathway", "Return · Local Integration · Relocation")
-            st.plotly_chart(pathway_distribution(fdf), width="stretch", config=PLOTLY_CONFIG)
-            st.markdown("<div style='height:6px'></div>", unsafe_allow_html=True)
-            section("By displacement status", "")
-            st.plotly_chart(status_distribution(fdf), width="stretch", config=PLOTLY_CONFIG)
-
-        st.markdown("<div style='height:18px'></div>", unsafe_allow_html=True)
-        section("Flow to durable solutions",
-                "Displacement status → solutions pathway → pathway stage")
-        st.plotly_chart(
-            create_sankey(fdf, "displacement_status", "solutions_pathway", "pathway_stage"),
-            width="stretch", config=PLOTLY_CONFIG,
-        )
-
-    # ==================== GEOGRAPHY ====================
+        render_overview(fdf, fkey)
     with tab_geo:
-        st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
-        section("Geographic distribution", "Each point is a registered household")
-
-        ctrl1, ctrl2, _ = st.columns([1.4, 1.4, 3])
-        with ctrl1:
-            color_by = st.selectbox(
-                "Colour by",
-                ["solutions_pathway", "displacement_status", "pathway_stage"],
-                format_func=lambda x: x.replace("_", " ").title(),
-            )
-        with ctrl2:
-            map_type = st.selectbox("Map type", ["Clusters", "Heatmap"])
-
-        if map_type == "Clusters":
-            m = create_cluster_map(fdf, color_by=color_by, zoom_start=6)
-        else:
-            m = create_heatmap(fdf, weight_col="household_size", zoom_start=6)
-        st_folium(m, height=500, use_container_width=True, returned_objects=[])
-
-        st.markdown("<div style='height:20px'></div>", unsafe_allow_html=True)
-        section("Regional summary", "")
-        summary = get_regional_summary(fdf).rename(columns={
-            "region": "Region", "beneficiaries": "Beneficiaries", "individuals": "Individuals",
-            "achieved": "Achieved", "livelihood_support": "Livelihood",
-            "achievement_rate": "Achievement %", "female_hoh_rate": "Female HoH %",
-        })[["Region", "Beneficiaries", "Individuals", "Achieved",
-            "Livelihood", "Achievement %", "Female HoH %"]]
-        st.dataframe(
-            summary.style
-            .format({"Beneficiaries": "{:,.0f}", "Individuals": "{:,.0f}",
-                     "Achieved": "{:,.0f}", "Livelihood": "{:,.0f}",
-                     "Achievement %": "{:.1f}%", "Female HoH %": "{:.1f}%"})
-            .background_gradient(subset=["Achievement %"], cmap="Greens"),
-            width="stretch", hide_index=True,
-        )
-
-    # ==================== PROGRESS ====================
+        render_geography(fdf, derived["regional"])
     with tab_progress:
-        st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
-        section("Registrations over time", "Monthly intake and cumulative reach")
-        st.plotly_chart(trend_chart(get_monthly_trends(fdf)), width="stretch", config=PLOTLY_CONFIG)
-
-        st.markdown("<div style='height:18px'></div>", unsafe_allow_html=True)
-        c1, c2 = st.columns(2, gap="large")
-        with c1:
-            section("Stage by region", "")
-            st.plotly_chart(stage_composition(fdf, "region"), width="stretch", config=PLOTLY_CONFIG)
-        with c2:
-            section("Stage by pathway", "")
-            st.plotly_chart(stage_composition(fdf, "solutions_pathway"), width="stretch", config=PLOTLY_CONFIG)
-
-        st.markdown("<div style='height:18px'></div>", unsafe_allow_html=True)
-        c3, c4 = st.columns(2, gap="large")
-        with c3:
-            section("Shelter status", "")
-            st.plotly_chart(shelter_distribution(fdf), width="stretch", config=PLOTLY_CONFIG)
-        with c4:
-            section("Documentation status", "")
-            st.plotly_chart(documentation_distribution(fdf), width="stretch", config=PLOTLY_CONFIG)
-
-        st.markdown("<div style='height:22px'></div>", unsafe_allow_html=True)
-        section("Progress against targets", "Programme planning goals, not derived from actuals")
-
-        total = kpis["total_beneficiaries"]
-        tcol1, tcol2 = st.columns(2, gap="large")
-        with tcol1:
-            st.markdown("**Effectiveness**")
-            render_target_bar("Solutions achieved (35%)", kpis["solutions_achieved"],
-                              round(total * 0.35), accent="#059669")
-            render_target_bar("Livelihood support (60%)", kpis["livelihood_support_count"],
-                              round(total * 0.60), accent="#3B82F6")
-            render_target_bar("Complete documentation (75%)", kpis["complete_documentation"],
-                              round(total * 0.75), accent="#8B5CF6")
-            render_target_bar("Permanent shelter (45%)", kpis["permanent_shelter"],
-                              round(total * 0.45), accent="#14B8A6")
-        with tcol2:
-            st.markdown("**Coverage**")
-            render_target_bar("Total beneficiaries reached", kpis["total_beneficiaries"],
-                              600, accent=PRIMARY)
-            render_target_bar("Female-headed households (40%)",
-                              kpis["female_hoh_percentage"] * 100, 40, accent="#8B5CF6", unit="%")
-            render_target_bar("Regions covered", kpis["regions_covered"],
-                              df["region"].nunique(), accent="#F59E0B")
-            render_target_bar("Districts covered", kpis["districts_covered"],
-                              df["district"].nunique(), accent="#3B82F6")
+        render_progress(fdf, kpis, df, derived["monthly"], fkey)
 
     st.markdown(
         """
@@ -7,6 +7,7 @@ deliberately avoided in favour of bars that read clearly with lots of
 whitespace.
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
@@ -71,27 +72,56 @@ def _category_hbar(counts: pd.Series, color_map: dict, height: int = 240) -> go.
 
 
 def pathway_distribution(df: pd.DataFrame) -> go.Figure:
-    return _category_hbar(df["solutions_pathway"].value_counts(), PATHWAY_COLORS)
+    # value_counts on a categorical column reports zero for categories a
+    # filter removed entirely; drop those so no phantom bars render.
+    counts = df["solutions_pathway"].value_counts()
+    return _category_hbar(counts[counts > 0], PATHWAY_COLORS)
 
 
 def status_distribution(df: pd.DataFrame) -> go.Figure:
-    return _category_hbar(df["displacement_status"].value_counts(), STATUS_COLORS)
+    counts = df["displacement_status"].value_counts()
+    return _category_hbar(counts[counts > 0], STATUS_COLORS)
+
+
+def _ordered_counts(ser: pd.Series, order: list) -> pd.Series:
+    """Count each label of a fixed order via one bincount over the codes.
+
+    Equivalent to value_counts().reindex(order).fillna(0) without the hash
+    pass or the reindex.
+    """
+    cat = pd.Categorical(ser, categories=order)
+    codes = cat.codes
+    return pd.Series(np.bincount(codes[codes >= 0], minlength=len(order)), index=order)
 
 
 def shelter_distribution(df: pd.DataFrame) -> go.Figure:
-    order = ["Emergency", "Transitional", "Permanent"]
-    counts = df["shelter_status"].value_counts().reindex(order).fillna(0)
+    counts = _ordered_counts(df["shelter_status"], ["Emergency", "Transitional", "Permanent"])
     return _category_hbar(counts, SHELTER_COLORS, height=220)
 
 
 def documentation_distribution(df: pd.DataFrame) -> go.Figure:
-    order = ["None", "Partial", "Complete"]
-    counts = df["documentation_status"].value_counts().reindex(order).fillna(0)
+    counts = _ordered_counts(df["documentation_status"], ["None", "Partial", "Complete"])
     return _category_hbar(counts, DOC_COLORS, height=220)
 
 
+# Cap on points per trend trace: beyond this, each extra point only adds
+# JSON payload and browser work without adding visible detail.
+MAX_TREND_POINTS = 500
+
+
+def _thin_trend(monthly: pd.DataFrame) -> pd.DataFrame:
+    """Evenly thin an over-long trend frame, always keeping the last point."""
+    step = -(-len(monthly) // MAX_TREND_POINTS)  # ceil division
+    thinned = monthly.iloc[::step]
+    if thinned.index[-1] != monthly.index[-1]:
+        thinned = pd.concat([thinned, monthly.iloc[[-1]]])
+    return thinned
+
+
 def trend_chart(monthly: pd.DataFrame) -> go.Figure:
     """Monthly registrations (soft bars) with a cumulative line on a 2nd axis."""
+    if len(monthly) > MAX_TREND_POINTS:
+        monthly = _thin_trend(monthly)
     fig = go.Figure()
     fig.add_trace(go.Bar(
         x=monthly["month"],
@@ -123,12 +153,27 @@ def trend_chart(monthly: pd.DataFrame) -> go.Figure:
 
 def stage_composition(df: pd.DataFrame, by: str) -> go.Figure:
     """Stacked horizontal bars: stage mix within each category (region/pathway)."""
-    pivot = (
-        df.groupby([by, "pathway_stage"]).size().unstack(fill_value=0)
-        .reindex(columns=STAGE_ORDER, fill_value=0)
-    )
-    # Order rows by total caseload (largest at top).
-    pivot = pivot.loc[pivot.sum(axis=1).sort_values(ascending=True).index]
+    # One bincount over the combined category codes yields the same count
+    # matrix as groupby([...]).size().unstack() in a single C pass, with no
+    # hashing and no reshape.
+    by_ser = df[by] if df[by].dtype == "category" else df[by].astype("category")
+    by_codes = by_ser.cat.codes.to_numpy()
+    stage_codes = pd.Categorical(df["pathway_stage"], categories=STAGE_ORDER).codes
+    groups = by_ser.cat.categories
+    n_by, n_stage = len(groups), len(STAGE_ORDER)
+
+    # Guard both code arrays: NaN (or an unexpected label) encodes as -1,
+    # which would turn the combined index negative and crash bincount.
+    valid = (by_codes >= 0) & (stage_codes >= 0)
+    counts = np.bincount(
+        by_codes[valid] * n_stage + stage_codes[valid], minlength=n_by * n_stage,
+    ).reshape(n_by, n_stage)
+
+    pivot = pd.DataFrame(counts, index=groups, columns=STAGE_ORDER)
+    # Drop categories absent from the (possibly filtered) frame, then order
+    # rows by total caseload (largest at top).
+    totals = pivot.sum(axis=1)
+    pivot = pivot.loc[totals[totals > 0].sort_values(ascending=True).index]
 
     fig = go.Figure()
     for stage in STAGE_ORDER:
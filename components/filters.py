@@ -4,26 +4,62 @@ Renders sidebar filter controls for dashboard interactivity.
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 
+def build_filter_options(df: pd.DataFrame) -> Dict:
+    """
+    Precompute the option list for every sidebar filter control.
+
+    Each selectbox used to call sorted(df[col].unique()) on every rerun —
+    seven full-column scans before any filter was applied. Building the
+    lists once (and caching the result in the app) makes the sidebar a set
+    of dict lookups.
+
+    Args:
+        df: DataFrame with beneficiary data
+
+    Returns:
+        Dictionary of option lists, plus a district-by-region lookup
+    """
+
+    option_cols = [
+        'region', 'district', 'solutions_pathway', 'displacement_status',
+        'gender_hoh', 'shelter_status', 'documentation_status',
+    ]
+    options = {
+        col: sorted(df[col].dropna().unique().tolist()) for col in option_cols
+    }
+    options['district_by_region'] = {
+        region: sorted(df.loc[df['region'] == region, 'district'].unique().tolist())
+        for region in options['region']
+    }
+    return options
+
+
 def render_sidebar_filters(
     df: pd.DataFrame,
-    date_col: str = 'registration_date'
+    date_col: str = 'registration_date',
+    options: Optional[Dict] = None
 ) -> Dict:
     """
     Render sidebar filter controls and return selected filter values.
-    
+
     Args:
         df: DataFrame with beneficiary data
         date_col: Column name for date filtering
-        
+        options: Precomputed option lists from build_filter_options
+
     Returns:
         Dictionary of selected filter values
     """
-    
+
+    if options is None:
+        options = build_filter_options(df)
+
     filters = {}
     
     # Sidebar header
@@ -41,35 +77,38 @@ def render_sidebar_filters(
     """, unsafe_allow_html=True)
     
     # Region filter
-    regions = ['All'] + sorted(df['region'].unique().tolist())
+    regions = ['All'] + options['region']
     filters['region'] = st.sidebar.selectbox(
         'Region',
         options=regions,
         index=0,
+        key='flt_region',
         help="Filter by geographic region"
     )
-    
+
     # District filter (dependent on region)
     if filters['region'] != 'All':
-        districts = ['All'] + sorted(df[df['region'] == filters['region']]['district'].unique().tolist())
+        districts = ['All'] + options['district_by_region'][filters['region']]
     else:
-        districts = ['All'] + sorted(df['district'].unique().tolist())
+        districts = ['All'] + options['district']
     
     filters['district'] = st.sidebar.selectbox(
         'District',
         options=districts,
         index=0,
+        key='flt_district',
         help="Filter by district"
     )
     
     st.sidebar.markdown("<br>", unsafe_allow_html=True)
     
     # Solutions pathway filter
-    pathways = ['All'] + sorted(df['solutions_pathway'].unique().tolist())
+    pathways = ['All'] + options['solutions_pathway']
     filters['solutions_pathway'] = st.sidebar.selectbox(
         'Solutions Pathway',
         options=pathways,
         index=0,
+        key='flt_pathway',
         help="Filter by durable solutions pathway"
     )
     
@@ -79,17 +118,19 @@ def render_sidebar_filters(
         'Pathway Stage',
         options=stages,
         index=0,
+        key='flt_stage',
         help="Filter by progress stage"
     )
     
     st.sidebar.markdown("<br>", unsafe_allow_html=True)
     
     # Displacement status filter
-    statuses = ['All'] + sorted(df['displacement_status'].unique().tolist())
+    statuses = ['All'] + options['displacement_status']
     filters['displacement_status'] = st.sidebar.selectbox(
         'Displacement Status',
         options=statuses,
         index=0,
+        key='flt_status',
         help="Filter by displacement status"
     )
     
@@ -102,9 +143,9 @@ def render_sidebar_filters(
     </p>
     """, unsafe_allow_html=True)
     
-    # Convert date column to datetime if needed
+    # The date column is parsed to datetime at load time; re-coercing here
+    # would mutate the cached frame and re-parse the column on every rerun.
     if date_col in df.columns:
-        df[date_col] = pd.to_datetime(df[date_col])
         min_date = df[date_col].min().date()
         max_date = df[date_col].max().date()
         
@@ -113,6 +154,7 @@ def render_sidebar_filters(
             value=(min_date, max_date),
             min_value=min_date,
             max_value=max_date,
+            key='flt_dates',
             help="Filter by registration date range"
         )
         
@@ -129,19 +171,21 @@ def render_sidebar_filters(
     # Additional filters (collapsible)
     with st.sidebar.expander("Additional Filters", expanded=False):
         # Gender of HoH filter
-        genders = ['All'] + sorted(df['gender_hoh'].unique().tolist())
+        genders = ['All'] + options['gender_hoh']
         filters['gender_hoh'] = st.selectbox(
             'Gender of Head of Household',
             options=genders,
-            index=0
+            index=0,
+            key='flt_gender'
         )
         
         # Shelter status filter
-        shelter_statuses = ['All'] + sorted(df['shelter_status'].unique().tolist())
+        shelter_statuses = ['All'] + options['shelter_status']
         filters['shelter_status'] = st.selectbox(
             'Shelter Status',
             options=shelter_statuses,
-            index=0
+            index=0,
+            key='flt_shelter'
         )
         
         # Livelihood support filter
@@ -149,15 +193,17 @@ def render_sidebar_filters(
         filters['livelihood_support'] = st.selectbox(
             'Livelihood Support',
             options=livelihood_options,
-            index=0
+            index=0,
+            key='flt_livelihood'
         )
         
         # Documentation status filter
-        doc_statuses = ['All'] + sorted([x for x in df['documentation_status'].unique().tolist() if pd.notna(x)])
+        doc_statuses = ['All'] + options['documentation_status']
         filters['documentation_status'] = st.selectbox(
             'Documentation Status',
             options=doc_statuses,
-            index=0
+            index=0,
+            key='flt_documentation'
         )
         
         # Household size filter
@@ -167,13 +213,18 @@ def render_sidebar_filters(
             'Household Size',
             min_value=min_hh,
             max_value=max_hh,
-            value=(min_hh, max_hh)
+            value=(min_hh, max_hh),
+            key='flt_household'
         )
     
     st.sidebar.markdown("---")
     
-    # Reset filters button
+    # Reset filters button: clear the widget state behind every filter so
+    # the rerun actually starts from defaults (a bare st.rerun() would
+    # recompute the same selections).
     if st.sidebar.button('Reset All Filters', width='stretch'):
+        for key in [k for k in st.session_state if k.startswith('flt_')]:
+            del st.session_state[key]
         st.rerun()
     
     # Data summary
@@ -199,36 +250,46 @@ def apply_filters(df: pd.DataFrame, filters: Dict) -> pd.DataFrame:
         Filtered DataFrame
     """
     
-    filtered_df = df.copy()
-    
-    # Apply categorical filters
+    # Build one boolean mask per active filter, then AND them all at once so
+    # the original frame is indexed exactly once — no up-front copy and no
+    # per-filter intermediate slices (each of which would reallocate data and
+    # rehash the index).
+    masks = []
+
+    # Categorical filters
     categorical_filters = [
         'region', 'district', 'solutions_pathway', 'pathway_stage',
         'displacement_status', 'gender_hoh', 'shelter_status',
         'livelihood_support', 'documentation_status'
     ]
-    
+
     for col in categorical_filters:
         if col in filters and filters[col] != 'All':
-            filtered_df = filtered_df[filtered_df[col] == filters[col]]
-    
-    # Apply date filter
+            masks.append((df[col] == filters[col]).to_numpy())
+
+    # Date range filter (registration_date is already datetime from load).
+    # Skipped while the selection still spans the full data range, so an
+    # untouched sidebar contributes no mask here.
     if 'date_start' in filters and 'date_end' in filters:
-        filtered_df['registration_date'] = pd.to_datetime(filtered_df['registration_date'])
-        filtered_df = filtered_df[
-            (filtered_df['registration_date'].dt.date >= filters['date_start']) &
-            (filtered_df['registration_date'].dt.date <= filters['date_end'])
-        ]
-    
-    # Apply household size range filter
+        dates = df['registration_date'].to_numpy().astype('datetime64[D]')
+        start = np.datetime64(filters['date_start'])
+        end = np.datetime64(filters['date_end'])
+        if len(dates) and (start > dates.min() or end < dates.max()):
+            masks.append((dates >= start) & (dates <= end))
+
+    # Household size range filter — same default detection as above.
     if 'household_size_range' in filters:
         min_size, max_size = filters['household_size_range']
-        filtered_df = filtered_df[
-            (filtered_df['household_size'] >= min_size) &
-            (filtered_df['household_size'] <= max_size)
-        ]
-    
-    return filtered_df
+        hh = df['household_size'].to_numpy()
+        if len(hh) and (min_size > hh.min() or max_size < hh.max()):
+            masks.append((hh >= min_size) & (hh <= max_size))
+
+    # Everything at its default: hand the original frame back untouched.
+    if not masks:
+        return df
+
+    mask = np.logical_and.reduce(masks)
+    return df.iloc[np.flatnonzero(mask)]
 
 
 def get_quick_filter_buttons(df: pd.DataFrame) -> Optional[str]:
@@ -22,16 +22,15 @@ def _fmt(value: Union[int, float]) -> str:
     return f"{value:,.0f}"
 
 
-def render_metric(label: str, value: Union[int, float, str], caption: str = "",
-                  accent: str = PRIMARY, value_suffix: str = "") -> None:
-    """Render a single flat metric card."""
+def _metric_html(label: str, value: Union[int, float, str], caption: str = "",
+                 accent: str = PRIMARY, value_suffix: str = "") -> str:
+    """Markup for one flat metric card."""
     display = value if isinstance(value, str) else _fmt(value)
     caption_html = (
         f'<div style="color:{MUTED};font-size:12px;margin-top:6px;">{caption}</div>'
         if caption else ""
     )
-    st.markdown(
-        f"""
+    return f"""
         <div style="background:#FFFFFF;border:1px solid {BORDER};border-radius:14px;
                     padding:18px 20px;height:100%;">
             <div style="display:flex;align-items:center;gap:8px;">
@@ -45,36 +44,59 @@ def render_metric(label: str, value: Union[int, float, str], caption: str = "",
                         font-weight:600;color:{MUTED};">{value_suffix}</span></div>
             {caption_html}
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
+        """
+
+
+def render_metric(label: str, value: Union[int, float, str], caption: str = "",
+                  accent: str = PRIMARY, value_suffix: str = "") -> None:
+    """Render a single flat metric card."""
+    st.markdown(_metric_html(label, value, caption, accent, value_suffix),
+                unsafe_allow_html=True)
 
 
 def render_metric_row(metrics: List[Dict]) -> None:
-    """Render a row of flat metric cards."""
-    cols = st.columns(len(metrics))
-    for col, m in zip(cols, metrics):
-        with col:
-            render_metric(
+    """Render a row of flat metric cards as one markdown element.
+
+    A flex container holding every card costs Streamlit a single element
+    per row instead of one st.columns call plus one markdown element per
+    card. The built markup is also kept in session_state keyed by the
+    metric values, so reruns that do not change the numbers skip the
+    formatting work. The st.markdown call itself still happens every run —
+    in Streamlit's rerun model an element that is not emitted disappears.
+    """
+    fingerprint = tuple(tuple(sorted(m.items())) for m in metrics)
+    cache = st.session_state.setdefault("_metric_row_html", {})
+    row_html = cache.get(fingerprint)
+    if row_html is None:
+        cards = "".join(
+            '<div style="flex:1 1 0;min-width:0;">'
+            + _metric_html(
                 label=m.get("label", ""),
                 value=m.get("value", 0),
                 caption=m.get("caption", ""),
                 accent=m.get("accent", PRIMARY),
                 value_suffix=m.get("value_suffix", ""),
             )
+            + "</div>"
+            for m in metrics
+        )
+        row_html = f'<div style="display:flex;gap:16px;align-items:stretch;">{cards}</div>'
+        if len(cache) >= 8:
+            cache.pop(next(iter(cache)))
+        cache[fingerprint] = row_html
+    st.markdown(row_html, unsafe_allow_html=True)
 
 
-def render_target_bar(label: str, current: Union[int, float],
-                      target: Union[int, float], accent: str = PRIMARY,
-                      unit: str = "") -> None:
-    """Thin progress bar showing current vs a programme target."""
+def _target_bar_html(label: str, current: Union[int, float],
+                     target: Union[int, float], accent: str = PRIMARY,
+                     unit: str = "") -> str:
+    """Markup for one thin current-vs-target progress bar."""
     target = max(target, 1)
     pct = min(current / target * 100, 100)
     cur_txt = f"{current:,.0f}{unit}" if not isinstance(current, str) else current
     tgt_txt = f"{target:,.0f}{unit}"
 
-    st.markdown(
-        f"""
+    return f"""
         <div style="margin-bottom:18px;">
             <div style="display:flex;justify-content:space-between;align-items:baseline;
                         margin-bottom:7px;">
@@ -88,6 +110,24 @@ def render_target_bar(label: str, current: Union[int, float],
                 <div style="width:{pct}%;height:100%;border-radius:999px;background:{accent};"></div>
             </div>
         </div>
-        """,
+        """
+
+
+def render_target_bar(label: str, current: Union[int, float],
+                      target: Union[int, float], accent: str = PRIMARY,
+                      unit: str = "") -> None:
+    """Thin progress bar showing current vs a programme target."""
+    st.markdown(_target_bar_html(label, current, target, accent, unit),
+                unsafe_allow_html=True)
+
+
+def render_target_bars(bars: List[Dict]) -> None:
+    """Render a stack of target bars as one markdown element.
+
+    Same batching as render_metric_row: N bars cost one st.markdown call
+    instead of N.
+    """
+    st.markdown(
+        "".join(_target_bar_html(**bar) for bar in bars),
         unsafe_allow_html=True,
     )
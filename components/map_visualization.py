@@ -4,12 +4,16 @@ Marker colours come from the shared design system.
 """
 
 import folium
-from folium.plugins import MarkerCluster, HeatMap
+from folium.plugins import FastMarkerCluster, MarkerCluster, HeatMap
+import numpy as np
 import pandas as pd
-from typing import Optional, List, Dict
+import streamlit as st
+from functools import lru_cache
+from typing import Optional, List, Dict, Tuple
 
 from utils.theme import (
-    PATHWAY_COLORS, STATUS_COLORS, STAGE_COLORS, INK, INK_SOFT, MUTED, BORDER,
+    PATHWAY_COLORS, STATUS_COLORS, STAGE_COLORS, PRIMARY, INK, INK_SOFT,
+    MUTED, BORDER,
 )
 
 _COLOR_MAPS = {
@@ -18,11 +22,32 @@ _COLOR_MAPS = {
     "pathway_stage": STAGE_COLORS,
 }
 
+# Above this row count, per-marker folium objects (one Python object + popup
+# HTML each) dominate render time; switch to FastMarkerCluster, which ships a
+# bare coordinate array to Leaflet instead.
+FAST_CLUSTER_THRESHOLD = 5000
+
+# Past this size even the bare coordinate array is a payload problem: the
+# browser receives one point per beneficiary only for the cluster plugin to
+# collapse them again. Pre-aggregate into fixed grid cells (~1 km at these
+# latitudes) and draw one sized marker per cell instead — the bucket count,
+# not the row count, bounds the work.
+GRID_BUCKET_THRESHOLD = 20_000
+GRID_CELL_DEG = 0.01
+
+# Content-based DataFrame hash for st.cache_data: cheap relative to
+# rebuilding thousands of folium markers, and stable across reruns that
+# pass the same filtered frame.
+_DF_HASH = {
+    pd.DataFrame: lambda d: (len(d), pd.util.hash_pandas_object(d, index=False).sum()),
+}
+
 
 def _color_map_for(color_by: str) -> Dict[str, str]:
     return _COLOR_MAPS.get(color_by, PATHWAY_COLORS)
 
 
+@st.cache_data(ttl=600, max_entries=32, hash_funcs=_DF_HASH)
 def create_cluster_map(
     df: pd.DataFrame,
     lat_col: str = "latitude",
@@ -44,26 +69,55 @@ def create_cluster_map(
         control_scale=True,
     )
 
+    if len(df) > GRID_BUCKET_THRESHOLD:
+        cells = _grid_buckets(df, lat_col, lon_col)
+        for lat, lon, count in cells.itertuples(index=False):
+            folium.CircleMarker(
+                location=[lat, lon],
+                radius=min(18.0, 4.0 + 2.0 * float(np.log1p(count))),
+                popup=folium.Popup(f"{int(count):,} beneficiaries", max_width=160),
+                color=PRIMARY,
+                weight=1,
+                fill=True,
+                fill_color=PRIMARY,
+                fill_opacity=0.6,
+            ).add_to(m)
+        return m
+
+    if len(df) > FAST_CLUSTER_THRESHOLD:
+        # Coordinate-array clustering: marker creation happens client-side
+        # in the callback below, so Python ships one array instead of N
+        # marker objects. No colour coding (and therefore no legend), but it
+        # stays responsive where the rich markers below would not.
+        callback = (
+            "function (row) {"
+            f" var marker = L.circleMarker(new L.LatLng(row[0], row[1]),"
+            f" {{radius: 5, color: '{PRIMARY}', fillColor: '{PRIMARY}',"
+            " fillOpacity: 0.75, weight: 1});"
+            " marker.bindPopup(String(row[2]));"
+            " return marker;"
+            "};"
+        )
+        FastMarkerCluster(
+            df[[lat_col, lon_col, 'beneficiary_id']].to_numpy().tolist(),
+            callback=callback,
+            options={"maxClusterRadius": 45, "showCoverageOnHover": False},
+        ).add_to(m)
+        return m
+
     cluster = MarkerCluster(options={"maxClusterRadius": 45, "showCoverageOnHover": False})
 
-    for _, row in df.iterrows():
-        marker_color = color_map.get(row.get(color_by, ""), MUTED)
-        popup_html = f"""
-        <div style="font-family:Inter,sans-serif;width:190px;color:{INK};">
-            <div style="font-weight:600;font-size:13px;border-bottom:1px solid {BORDER};
-                        padding-bottom:6px;margin-bottom:6px;">{row.get('beneficiary_id','')}</div>
-            <table style="width:100%;font-size:12px;color:{INK_SOFT};">
-                <tr><td>Region</td><td style="text-align:right;color:{INK};">{row.get('region','')}</td></tr>
-                <tr><td>District</td><td style="text-align:right;color:{INK};">{row.get('district','')}</td></tr>
-                <tr><td>Status</td><td style="text-align:right;color:{INK};">{row.get('displacement_status','')}</td></tr>
-                <tr><td>Pathway</td><td style="text-align:right;color:{INK};">{row.get('solutions_pathway','')}</td></tr>
-                <tr><td>Stage</td><td style="text-align:right;color:{INK};">{row.get('pathway_stage','')}</td></tr>
-                <tr><td>Household</td><td style="text-align:right;color:{INK};">{row.get('household_size','')}</td></tr>
-            </table>
-        </div>
-        """
+    # Colours and popup HTML are precomputed as vectorized column operations,
+    # so the loop below only zips plain ndarrays — no per-row Series
+    # allocation and no per-row dict lookups.
+    colors = df[color_by].map(color_map).fillna(MUTED).to_numpy()
+    popups = _popup_html_column(df).to_numpy()
+    lats = df[lat_col].to_numpy()
+    lons = df[lon_col].to_numpy()
+
+    for lat, lon, marker_color, popup_html in zip(lats, lons, colors, popups):
         folium.CircleMarker(
-            location=[row[lat_col], row[lon_col]],
+            location=[lat, lon],
             radius=6,
             popup=folium.Popup(popup_html, max_width=240),
             color=marker_color,
@@ -78,15 +132,58 @@ def create_cluster_map(
     return m
 
 
+def _grid_buckets(df: pd.DataFrame, lat_col: str, lon_col: str,
+                  cell: float = GRID_CELL_DEG) -> pd.DataFrame:
+    """Collapse points into `cell`-degree grid cells: (lat, lon, count)."""
+    lat_bin = (df[lat_col] / cell).round() * cell
+    lon_bin = (df[lon_col] / cell).round() * cell
+    return (
+        df.groupby([lat_bin, lon_bin], observed=True)
+        .size()
+        .reset_index(name='count')
+    )
+
+
+def _popup_html_column(df: pd.DataFrame) -> pd.Series:
+    """Build every marker's popup HTML in one pass of string-concat ops."""
+    cols = df[['beneficiary_id', 'region', 'district', 'displacement_status',
+               'solutions_pathway', 'pathway_stage', 'household_size']].astype(str)
+
+    def field(label: str, values: pd.Series) -> pd.Series:
+        return (f'<tr><td>{label}</td><td style="text-align:right;color:{INK};">'
+                + values + '</td></tr>')
+
+    return (
+        f'<div style="font-family:Inter,sans-serif;width:190px;color:{INK};">'
+        f'<div style="font-weight:600;font-size:13px;border-bottom:1px solid {BORDER};'
+        'padding-bottom:6px;margin-bottom:6px;">' + cols['beneficiary_id'] + '</div>'
+        f'<table style="width:100%;font-size:12px;color:{INK_SOFT};">'
+        + field('Region', cols['region'])
+        + field('District', cols['district'])
+        + field('Status', cols['displacement_status'])
+        + field('Pathway', cols['solutions_pathway'])
+        + field('Stage', cols['pathway_stage'])
+        + field('Household', cols['household_size'])
+        + '</table></div>'
+    )
+
+
 def _legend_html(color_by: str, color_map: Dict[str, str]) -> str:
-    title = color_by.replace("_", " ").title()
+    # The three colour maps are module constants, so the legend markup for a
+    # given color_by never changes; memoise on the hashable items tuple.
+    return _legend_html_cached(color_by.replace("_", " ").title(),
+                               tuple(color_map.items()))
+
+
+@lru_cache(maxsize=8)
+def _legend_html_cached(title: str, color_items: Tuple[Tuple[str, str], ...]) -> str:
     items = "".join(
         f"""<div style="display:flex;align-items:center;margin-bottom:6px;">
                 <span style="width:10px;height:10px;border-radius:50%;background:{color};
                              margin-right:8px;"></span>
                 <span style="font-size:12px;color:{INK_SOFT};">{label}</span>
             </div>"""
-        for label, color in color_map.items()
+        for label, color in color_items
     )
     return f"""
     <div style="position:fixed;bottom:24px;left:24px;z-index:1000;background:#FFFFFF;
@@ -99,6 +196,7 @@ def _legend_html(color_by: str, color_map: Dict[str, str]) -> str:
     """
 
 
+@st.cache_data(ttl=600, max_entries=32, hash_funcs=_DF_HASH)
 def create_heatmap(
     df: pd.DataFrame,
     lat_col: str = "latitude",
@@ -113,10 +211,12 @@ def create_heatmap(
 
     m = folium.Map(location=center, zoom_start=zoom_start, tiles="CartoDB positron")
 
+    # HeatMap iterates whatever it is given, so hand it the ndarray directly
+    # instead of materialising a list-of-lists of boxed Python floats first.
     if weight_col and weight_col in df.columns:
-        heat_data = df[[lat_col, lon_col, weight_col]].values.tolist()
+        heat_data = df[[lat_col, lon_col, weight_col]].to_numpy()
     else:
-        heat_data = df[[lat_col, lon_col]].values.tolist()
+        heat_data = df[[lat_col, lon_col]].to_numpy()
 
     HeatMap(
         heat_data,
@@ -3,6 +3,7 @@ Sankey flow diagram: displacement status → solutions pathway → pathway stage
 Restyled to the minimal design system (muted nodes, soft links, no chrome).
 """
 
+import numpy as np
 import plotly.graph_objects as go
 import pandas as pd
 
@@ -20,6 +21,13 @@ def _rgba(hex_color: str, alpha: float) -> str:
     return f"rgba({r}, {g}, {b}, {alpha})"
 
 
+# Links inherit their source node's colour at 28% opacity. Parsed from hex
+# once here instead of re-slicing the hex string for every link on every
+# figure build.
+LINK_COLORS = {label: _rgba(color, 0.28) for label, color in NODE_COLORS.items()}
+_LINK_FALLBACK = _rgba(MUTED, 0.28)
+
+
 def create_sankey(
     df: pd.DataFrame,
     source_col: str = "displacement_status",
@@ -28,25 +36,42 @@ def create_sankey(
     title: str = "",
 ) -> go.Figure:
     """Three-column Sankey of beneficiary flow."""
-    source_values = df[source_col].unique().tolist()
-    middle_values = df[middle_col].unique().tolist()
-    target_values = df[target_col].unique().tolist()
-    labels = source_values + middle_values + target_values
+    # One full-frame groupby over all three columns; the two link layers are
+    # marginal sums of that (tiny) result, so the frame is hash-grouped once
+    # instead of twice.
+    counts = df.groupby([source_col, middle_col, target_col], observed=True).size()
+
+    # The groupby index already holds every observed label per column — no
+    # need for three more full-column unique() scans.
+    def observed(level: int) -> list:
+        return counts.index.get_level_values(level).unique().tolist()
+
+    labels = observed(0) + observed(1) + observed(2)
     idx = {label: i for i, label in enumerate(labels)}
     node_colors = [NODE_COLORS.get(label, MUTED) for label in labels]
 
-    sources, targets, values, link_colors = [], [], [], []
-
-    def add_flows(left_col, right_col):
-        flows = df.groupby([left_col, right_col]).size().reset_index(name="count")
-        for _, row in flows.iterrows():
-            sources.append(idx[row[left_col]])
-            targets.append(idx[row[right_col]])
-            values.append(int(row["count"]))
-            link_colors.append(_rgba(NODE_COLORS.get(row[left_col], MUTED), 0.28))
+    def flow_arrays(flows):
+        # Map whole label columns to node indices in one pass each instead of
+        # one dict lookup per edge. The flow columns are categorical and can
+        # carry categories absent from this frame (and from idx), which turns
+        # the mapped result float64; every row's own label is observed, so
+        # casting back to int64 is safe.
+        left, right = flows.iloc[:, 0], flows.iloc[:, 1]
+        return (
+            left.map(idx).to_numpy(np.int64),
+            right.map(idx).to_numpy(np.int64),
+            flows["count"].to_numpy(),
+            left.map(LINK_COLORS).fillna(_LINK_FALLBACK).tolist(),
+        )
 
-    add_flows(source_col, middle_col)
-    add_flows(middle_col, target_col)
+    layers = [
+        flow_arrays(counts.groupby(level=[0, 1], observed=True).sum().reset_index(name="count")),
+        flow_arrays(counts.groupby(level=[1, 2], observed=True).sum().reset_index(name="count")),
+    ]
+    sources, targets, values = (
+        np.concatenate([layer[i] for layer in layers]) for i in range(3)
+    )
+    link_colors = layers[0][3] + layers[1][3]
 
     fig = go.Figure(go.Sankey(
         arrangement="snap",
@@ -3,49 +3,122 @@ Data Processing Utilities
 Functions for loading, processing, and analyzing displacement data.
 """
 
+import os
+
 import pandas as pd
 import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Tuple, List, Optional
 from datetime import datetime, timedelta
 
+from utils.theme import STAGE_ORDER
+
+# Single worker for background Excel exports: one export at a time keeps
+# file writes serialised while the dashboard thread stays responsive.
+_EXPORT_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# Processed frames keyed by (path, mtime): repeat calls for an unchanged
+# file skip the parse entirely, and editing the CSV invalidates the entry
+# because its mtime moves. Callers treat the frame as read-only.
+_LOAD_CACHE: Dict[Tuple[str, float], pd.DataFrame] = {}
+_LOAD_CACHE_MAX = 4
+
 
 def load_and_process_data(filepath: str) -> pd.DataFrame:
     """
     Load and preprocess the displacement data.
-    
+
     Args:
         filepath: Path to the CSV file
-        
+
     Returns:
         Processed DataFrame
     """
-    
+
+    cache_key = (filepath, os.path.getmtime(filepath))
+    cached = _LOAD_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Load data.
     # keep_default_na=False prevents pandas from coercing the literal string
     # "None" (a valid documentation_status category) into NaN, which would
     # silently drop those records from charts and filters.
-    df = pd.read_csv(filepath, keep_default_na=False, na_values=[''])
+    # Arrow's multi-threaded CSV reader parses noticeably faster than the
+    # default single-threaded C engine; fall back to the C engine where
+    # pyarrow is unavailable or rejects these options.
+    read_kwargs = dict(keep_default_na=False, na_values=[''])
+    try:
+        df = pd.read_csv(filepath, engine='pyarrow', **read_kwargs)
+    except (ImportError, ValueError):
+        df = pd.read_csv(filepath, **read_kwargs)
 
-    # Convert date column
+    # Convert date column (the Arrow engine may hand dates back as
+    # datetime.date objects; to_datetime normalises either way)
     df['registration_date'] = pd.to_datetime(df['registration_date'])
 
-    # Add derived columns
-    df['registration_month'] = df['registration_date'].dt.to_period('M')
-    df['registration_year'] = df['registration_date'].dt.year
-    df['registration_quarter'] = df['registration_date'].dt.to_period('Q')
+    # Low-cardinality string columns get compared, grouped and counted on
+    # every dashboard rerun. As category dtype those operations run on small
+    # integer codes instead of Python strings, and the frame's memory
+    # footprint drops accordingly. Paid once here (load is cached upstream).
+    categorical_cols = [
+        'region', 'district', 'displacement_status', 'solutions_pathway',
+        'pathway_stage', 'gender_hoh', 'shelter_status', 'livelihood_support',
+        'documentation_status',
+    ]
+    for col in categorical_cols:
+        df[col] = df[col].astype('category')
+
+    # pathway_stage gets the programme's stage progression as an explicit
+    # ordered category set, so downstream crosstabs and charts come out in
+    # Assessment → Achieved order without reindexing.
+    df['pathway_stage'] = pd.Categorical(
+        df['pathway_stage'], categories=STAGE_ORDER, ordered=True)
+
+    # Add derived columns: plain integer codes computed from one pass over
+    # the datetime64 buffer (months/quarters count from the Unix epoch),
+    # instead of three dt accessor walks allocating Period arrays.
+    dt64 = df['registration_date'].to_numpy()
+    months_since_epoch = dt64.astype('datetime64[M]').astype(np.int64)
+    df['registration_year'] = dt64.astype('datetime64[Y]').astype(np.int64) + 1970
+    df['registration_month'] = months_since_epoch
+    df['registration_quarter'] = months_since_epoch // 3
 
-    # Each row is one household; household_size is the number of individuals in it.
-    df['total_individuals'] = df['household_size']
-    
     # Add binary columns for easier aggregation
     df['is_female_hoh'] = df['gender_hoh'] == 'Female'
     df['has_livelihood_support'] = df['livelihood_support'] == 'Yes'
     df['is_achieved'] = df['pathway_stage'] == 'Achieved'
     df['has_documentation'] = df['documentation_status'] == 'Complete'
-    
+
+    if len(_LOAD_CACHE) >= _LOAD_CACHE_MAX:
+        _LOAD_CACHE.pop(next(iter(_LOAD_CACHE)))
+    _LOAD_CACHE[cache_key] = df
+
     return df
 
 
+def _pathway_stage_crosstab(df: pd.DataFrame) -> pd.DataFrame:
+    """Pathway × stage count matrix shared by the KPI and progress views.
+
+    One bincount over the combined category codes replaces a two-column
+    hash groupby, and both marginals (per-stage and per-pathway totals)
+    fall out of the same matrix as row/column sums.
+    """
+    pathway = df['solutions_pathway'].cat
+    stage = df['pathway_stage'].cat
+    n_stage = len(stage.categories)
+    p_codes = pathway.codes.to_numpy()
+    s_codes = stage.codes.to_numpy()
+    valid = (p_codes >= 0) & (s_codes >= 0)
+    counts = np.bincount(
+        p_codes[valid] * n_stage + s_codes[valid],
+        minlength=len(pathway.categories) * n_stage,
+    ).reshape(len(pathway.categories), n_stage)
+    out = pd.DataFrame(counts, index=pathway.categories.copy(), columns=stage.categories.copy())
+    out.index.name = 'solutions_pathway'
+    return out
+
+
 def calculate_kpis(df: pd.DataFrame) -> Dict:
     """
     Calculate key performance indicators from the data.
@@ -57,58 +130,75 @@ def calculate_kpis(df: pd.DataFrame) -> Dict:
         Dictionary of KPI values
     """
     
+    # Each of the old len(df[df[col] == value]) lines allocated a boolean
+    # mask plus a sliced frame just to count rows. One bincount per
+    # categorical column and one reduction per boolean/numeric column gives
+    # the same numbers in a handful of C passes.
+    def counts_of(col: str) -> Dict:
+        codes = df[col].cat.codes.to_numpy()
+        cats = df[col].cat.categories
+        return dict(zip(cats, np.bincount(codes[codes >= 0], minlength=len(cats))))
+
+    total = len(df)
+    hh = df['household_size'].to_numpy()
+    # Stage and pathway breakdowns are the marginals of the shared
+    # pathway × stage matrix (also what get_pathway_progress reports).
+    crosstab = _pathway_stage_crosstab(df)
+    stage = crosstab.sum(axis=0)
+    pathway = crosstab.sum(axis=1)
+    shelter = counts_of('shelter_status')
+    status = counts_of('displacement_status')
+
     kpis = {}
-    
-    # Total beneficiaries (households)
-    kpis['total_beneficiaries'] = len(df)
-    
-    # Total individuals reached
-    kpis['total_individuals'] = df['household_size'].sum()
-    
+
+    # Total beneficiaries (households) / individuals reached
+    kpis['total_beneficiaries'] = total
+    kpis['total_individuals'] = int(hh.sum())
+
     # Solutions achieved
-    kpis['solutions_achieved'] = len(df[df['pathway_stage'] == 'Achieved'])
-    kpis['achievement_rate'] = kpis['solutions_achieved'] / kpis['total_beneficiaries'] if kpis['total_beneficiaries'] > 0 else 0
-    
+    kpis['solutions_achieved'] = int(stage.get('Achieved', 0))
+    kpis['achievement_rate'] = kpis['solutions_achieved'] / total if total > 0 else 0
+
     # Female-headed households
-    kpis['female_hoh_count'] = len(df[df['gender_hoh'] == 'Female'])
-    kpis['female_hoh_percentage'] = kpis['female_hoh_count'] / kpis['total_beneficiaries'] if kpis['total_beneficiaries'] > 0 else 0
-    
+    kpis['female_hoh_count'] = int(np.count_nonzero(df['is_female_hoh'].to_numpy()))
+    kpis['female_hoh_percentage'] = kpis['female_hoh_count'] / total if total > 0 else 0
+
     # Livelihood support
-    kpis['livelihood_support_count'] = len(df[df['livelihood_support'] == 'Yes'])
-    kpis['livelihood_support_percentage'] = kpis['livelihood_support_count'] / kpis['total_beneficiaries'] if kpis['total_beneficiaries'] > 0 else 0
-    
+    kpis['livelihood_support_count'] = int(np.count_nonzero(df['has_livelihood_support'].to_numpy()))
+    kpis['livelihood_support_percentage'] = kpis['livelihood_support_count'] / total if total > 0 else 0
+
     # Documentation status
-    kpis['complete_documentation'] = len(df[df['documentation_status'] == 'Complete'])
-    kpis['documentation_rate'] = kpis['complete_documentation'] / kpis['total_beneficiaries'] if kpis['total_beneficiaries'] > 0 else 0
-    
+    kpis['complete_documentation'] = int(np.count_nonzero(df['has_documentation'].to_numpy()))
+    kpis['documentation_rate'] = kpis['complete_documentation'] / total if total > 0 else 0
+
     # Shelter status breakdown
-    kpis['emergency_shelter'] = len(df[df['shelter_status'] == 'Emergency'])
-    kpis['transitional_shelter'] = len(df[df['shelter_status'] == 'Transitional'])
-    kpis['permanent_shelter'] = len(df[df['shelter_status'] == 'Permanent'])
-    
+    kpis['emergency_shelter'] = int(shelter.get('Emergency', 0))
+    kpis['transitional_shelter'] = int(shelter.get('Transitional', 0))
+    kpis['permanent_shelter'] = int(shelter.get('Permanent', 0))
+
     # Displacement status breakdown
-    kpis['idp_count'] = len(df[df['displacement_status'] == 'IDP'])
-    kpis['returnee_count'] = len(df[df['displacement_status'] == 'Returnee'])
-    kpis['host_community_count'] = len(df[df['displacement_status'] == 'Host Community'])
-    
+    kpis['idp_count'] = int(status.get('IDP', 0))
+    kpis['returnee_count'] = int(status.get('Returnee', 0))
+    kpis['host_community_count'] = int(status.get('Host Community', 0))
+
     # Solutions pathway breakdown
-    kpis['return_pathway'] = len(df[df['solutions_pathway'] == 'Return'])
-    kpis['local_integration_pathway'] = len(df[df['solutions_pathway'] == 'Local Integration'])
-    kpis['relocation_pathway'] = len(df[df['solutions_pathway'] == 'Relocation'])
-    
+    kpis['return_pathway'] = int(pathway.get('Return', 0))
+    kpis['local_integration_pathway'] = int(pathway.get('Local Integration', 0))
+    kpis['relocation_pathway'] = int(pathway.get('Relocation', 0))
+
     # Stage breakdown
-    kpis['assessment_stage'] = len(df[df['pathway_stage'] == 'Assessment'])
-    kpis['planning_stage'] = len(df[df['pathway_stage'] == 'Planning'])
-    kpis['implementation_stage'] = len(df[df['pathway_stage'] == 'Implementation'])
-    kpis['achieved_stage'] = len(df[df['pathway_stage'] == 'Achieved'])
-    
+    kpis['assessment_stage'] = int(stage.get('Assessment', 0))
+    kpis['planning_stage'] = int(stage.get('Planning', 0))
+    kpis['implementation_stage'] = int(stage.get('Implementation', 0))
+    kpis['achieved_stage'] = kpis['solutions_achieved']
+
     # Average household size
-    kpis['avg_household_size'] = df['household_size'].mean()
-    
+    kpis['avg_household_size'] = float(hh.mean()) if total > 0 else float('nan')
+
     # Regional coverage
     kpis['regions_covered'] = df['region'].nunique()
     kpis['districts_covered'] = df['district'].nunique()
-    
+
     return kpis
 
 
@@ -117,51 +207,63 @@ def prepare_sankey_data(
     source_col: str = 'displacement_status',
     middle_col: str = 'solutions_pathway',
     target_col: str = 'pathway_stage'
-) -> Tuple[List, List, List]:
+) -> Tuple[List, np.ndarray, np.ndarray, np.ndarray]:
     """
     Prepare data for Sankey diagram visualization.
-    
+
     Args:
         df: Processed DataFrame
         source_col: Source column name
         middle_col: Middle column name
         target_col: Target column name
-        
+
     Returns:
-        Tuple of (labels, sources, targets, values)
+        Tuple of (labels, sources, targets, values); the last three are
+        int64 arrays, which Plotly accepts directly
     """
     
-    # Get unique values
-    source_values = df[source_col].unique().tolist()
-    middle_values = df[middle_col].unique().tolist()
-    target_values = df[target_col].unique().tolist()
-    
+    # Labels and per-row codes for each column. For categorical columns the
+    # category list is stored alongside the codes, so both are attribute
+    # reads; other dtypes fall back to a unique() scan plus a recode that
+    # keeps codes aligned with positions in `labels`.
+    def labels_and_codes(col):
+        ser = df[col]
+        if isinstance(ser.dtype, pd.CategoricalDtype):
+            return ser.cat.categories.tolist(), ser.cat.codes.to_numpy(np.int64)
+        values = ser.unique().tolist()
+        return values, pd.Categorical(ser, categories=values).codes.astype(np.int64)
+
+    source_values, src = labels_and_codes(source_col)
+    middle_values, mid = labels_and_codes(middle_col)
+    target_values, tgt = labels_and_codes(target_col)
+
     # Create combined label list
     labels = source_values + middle_values + target_values
-    
-    # Create index mapping
-    label_to_idx = {label: idx for idx, label in enumerate(labels)}
-    
-    # Calculate flows
-    source_to_middle = df.groupby([source_col, middle_col]).size().reset_index(name='count')
-    middle_to_target = df.groupby([middle_col, target_col]).size().reset_index(name='count')
-    
-    sources = []
-    targets = []
-    values = []
-    
-    # Source to middle flows
-    for _, row in source_to_middle.iterrows():
-        sources.append(label_to_idx[row[source_col]])
-        targets.append(label_to_idx[row[middle_col]])
-        values.append(row['count'])
-    
-    # Middle to target flows
-    for _, row in middle_to_target.iterrows():
-        sources.append(label_to_idx[row[middle_col]])
-        targets.append(label_to_idx[row[target_col]])
-        values.append(row['count'])
-    
+
+    # Calculate flows by bincounting combined integer codes — one C pass per
+    # layer instead of a hash groupby, with cell index doubling as the edge's
+    # (source, target) pair.
+    n_src, n_mid, n_tgt = len(source_values), len(middle_values), len(target_values)
+
+    def layer(left, right, n_right, left_offset, right_offset):
+        valid = (left >= 0) & (right >= 0)
+        counts = np.bincount(left[valid] * n_right + right[valid])
+        edges = np.flatnonzero(counts)
+        return (left_offset + edges // n_right,
+                right_offset + edges % n_right,
+                counts[edges])
+
+    if len(df):
+        layers = [layer(src, mid, n_mid, 0, n_src),
+                  layer(mid, tgt, n_tgt, n_src, n_src + n_mid)]
+        sources, targets, values = (
+            np.concatenate([l[i] for l in layers]) for i in range(3)
+        )
+    else:
+        sources = targets = values = np.array([], dtype=np.int64)
+
+    # Hand the arrays straight to the caller; boxing every edge index into a
+    # Python int was the last leftover conversion here.
     return labels, sources, targets, values
 
 
@@ -182,19 +284,23 @@ def get_monthly_trends(
         DataFrame with monthly trends
     """
     
-    df = df.copy()
-    df['month'] = df[date_col].dt.to_period('M')
-    
+    # Month keys come straight from the datetime64 buffer truncated to
+    # month precision — no Period allocation, no frame copy, no hash
+    # groupby. np.unique returns the months already sorted, and its string
+    # form ('2022-06') matches the old Period labels.
+    months = df[date_col].to_numpy().astype('datetime64[M]')
+
     if value_col:
-        monthly = df.groupby('month')[value_col].sum().reset_index()
-        monthly.columns = ['month', 'value']
+        keys, inverse = np.unique(months, return_inverse=True)
+        values = np.bincount(inverse, weights=df[value_col].to_numpy())
+        if pd.api.types.is_integer_dtype(df[value_col]):
+            values = values.astype(np.int64)
     else:
-        monthly = df.groupby('month').size().reset_index(name='count')
-        monthly.columns = ['month', 'value']
-    
-    monthly['month'] = monthly['month'].astype(str)
+        keys, values = np.unique(months, return_counts=True)
+
+    monthly = pd.DataFrame({'month': keys.astype(str), 'value': values})
     monthly['cumulative'] = monthly['value'].cumsum()
-    
+
     return monthly
 
 
@@ -209,22 +315,34 @@ def get_regional_summary(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with regional summary
     """
     
-    summary = df.groupby('region').agg({
-        'beneficiary_id': 'count',
-        'household_size': 'sum',
-        'is_female_hoh': 'sum',
-        'is_achieved': 'sum',
-        'has_livelihood_support': 'sum'
-    }).reset_index()
-    
-    summary.columns = [
-        'region', 'beneficiaries', 'individuals',
-        'female_hoh', 'achieved', 'livelihood_support'
-    ]
-    
-    # Calculate percentages
-    summary['achievement_rate'] = (summary['achieved'] / summary['beneficiaries'] * 100).round(1)
-    summary['female_hoh_rate'] = (summary['female_hoh'] / summary['beneficiaries'] * 100).round(1)
+    # One bincount per metric over the region category codes replaces the
+    # hash groupby — each metric is a single cache-friendly pass over an
+    # int/bool array. Regions absent from this (possibly filtered) frame are
+    # dropped afterwards, matching the old observed-only groupby.
+    codes = df['region'].cat.codes.to_numpy()
+    valid = codes >= 0
+    codes = codes[valid]
+    n_regions = len(df['region'].cat.categories)
+
+    def per_region(col):
+        return np.bincount(codes, weights=df[col].to_numpy()[valid],
+                           minlength=n_regions).astype(np.int64)
+
+    summary = pd.DataFrame({
+        'region': df['region'].cat.categories,
+        'beneficiaries': np.bincount(codes, minlength=n_regions),
+        'individuals': per_region('household_size'),
+        'female_hoh': per_region('is_female_hoh'),
+        'achieved': per_region('is_achieved'),
+        'livelihood_support': per_region('has_livelihood_support'),
+    })
+    summary = summary[summary['beneficiaries'] > 0].reset_index(drop=True)
+    
+    # Calculate percentages on the underlying arrays — one temporary per
+    # rate instead of a Series per intermediate step
+    ben = summary['beneficiaries'].to_numpy()
+    summary['achievement_rate'] = np.round(summary['achieved'].to_numpy() / ben * 100, 1)
+    summary['female_hoh_rate'] = np.round(summary['female_hoh'].to_numpy() / ben * 100, 1)
     
     return summary.sort_values('beneficiaries', ascending=False)
 
@@ -240,18 +358,21 @@ def get_pathway_progress(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with pathway progress
     """
     
-    # Define stage order
-    stage_order = ['Assessment', 'Planning', 'Implementation', 'Achieved']
-    
-    progress = df.groupby(['solutions_pathway', 'pathway_stage']).size().unstack(fill_value=0)
-    
-    # Reorder columns
-    progress = progress.reindex(columns=stage_order, fill_value=0)
-    
-    # Calculate totals and percentages
-    progress['Total'] = progress.sum(axis=1)
-    progress['Achievement Rate'] = (progress['Achieved'] / progress['Total'] * 100).round(1)
-    
+    # pathway_stage is an ordered categorical, so the shared crosstab comes
+    # out in Assessment → Achieved column order with no reindex. Drop
+    # pathways with no rows in this (possibly filtered) frame, matching the
+    # old observed-only groupby.
+    progress = _pathway_stage_crosstab(df)
+    mat = progress.to_numpy()
+    observed = mat.sum(axis=1) > 0
+    progress, mat = progress.loc[observed], mat[observed]
+
+    # Totals and percentages as plain ndarray ops on the count matrix
+    totals = mat.sum(axis=1)
+    progress['Total'] = totals
+    progress['Achievement Rate'] = np.round(
+        mat[:, STAGE_ORDER.index('Achieved')] / totals * 100, 1)
+
     return progress
 
 
@@ -276,62 +397,106 @@ def calculate_period_comparison(
         Dictionary with comparison metrics
     """
     
-    current_df = df[
-        (df['registration_date'] >= current_start) &
-        (df['registration_date'] <= current_end)
-    ]
-    
-    previous_df = df[
-        (df['registration_date'] >= previous_start) &
-        (df['registration_date'] <= previous_end)
-    ]
-    
+    # When the frame is sorted by registration_date (true for the shipped
+    # CSV), each period is a contiguous slice found with two binary searches
+    # instead of two full-column boolean masks. Unsorted frames keep the
+    # mask path.
+    if df['registration_date'].is_monotonic_increasing:
+        dates = df['registration_date'].to_numpy()
+
+        def period_frame(start, end):
+            lo = dates.searchsorted(np.datetime64(start), side='left')
+            hi = dates.searchsorted(np.datetime64(end), side='right')
+            return df.iloc[lo:hi]
+    else:
+        def period_frame(start, end):
+            return df[
+                (df['registration_date'] >= start) &
+                (df['registration_date'] <= end)
+            ]
+
+    current_df = period_frame(current_start, current_end)
+    previous_df = period_frame(previous_start, previous_end)
+    
+    # Each aggregate is computed once and reused for its change delta; the
+    # precomputed is_achieved column spares re-deriving the stage mask.
+    cur_ach = int(current_df['is_achieved'].sum())
+    prev_ach = int(previous_df['is_achieved'].sum())
+    cur_ind = int(current_df['household_size'].sum())
+    prev_ind = int(previous_df['household_size'].sum())
+
     comparison = {
         'current_beneficiaries': len(current_df),
         'previous_beneficiaries': len(previous_df),
         'beneficiary_change': len(current_df) - len(previous_df),
-        
-        'current_achieved': len(current_df[current_df['pathway_stage'] == 'Achieved']),
-        'previous_achieved': len(previous_df[previous_df['pathway_stage'] == 'Achieved']),
-        'achieved_change': len(current_df[current_df['pathway_stage'] == 'Achieved']) - 
-                          len(previous_df[previous_df['pathway_stage'] == 'Achieved']),
-        
-        'current_individuals': current_df['household_size'].sum(),
-        'previous_individuals': previous_df['household_size'].sum(),
-        'individuals_change': current_df['household_size'].sum() - previous_df['household_size'].sum()
+
+        'current_achieved': cur_ach,
+        'previous_achieved': prev_ach,
+        'achieved_change': cur_ach - prev_ach,
+
+        'current_individuals': cur_ind,
+        'previous_individuals': prev_ind,
+        'individuals_change': cur_ind - prev_ind
     }
-    
+
     return comparison
 
 
-def export_to_excel(df: pd.DataFrame, filepath: str, summary: bool = True) -> None:
+def export_to_excel(df: pd.DataFrame, filepath: str, summary: bool = True,
+                    background: bool = False) -> Optional[Future]:
     """
     Export data to Excel with multiple sheets.
-    
+
     Args:
         df: Processed DataFrame
         filepath: Output file path
         summary: Whether to include summary sheets
+        background: Submit the export to a worker thread and return its
+            Future instead of blocking the caller
     """
-    
-    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-        # Raw data
-        df.to_excel(writer, sheet_name='Raw Data', index=False)
-        
+
+    if background:
+        return _EXPORT_EXECUTOR.submit(export_to_excel, df, filepath, summary)
+
+    # xlsxwriter in constant_memory mode streams rows out as they are
+    # written instead of holding the whole workbook in memory the way
+    # openpyxl does; keep openpyxl as the fallback engine.
+    try:
+        writer = pd.ExcelWriter(
+            filepath, engine='xlsxwriter',
+            engine_kwargs={'options': {'constant_memory': True}},
+        )
+    except ImportError:
+        writer = pd.ExcelWriter(filepath, engine='openpyxl')
+
+    with writer:
         if summary:
-            # Regional summary
-            regional = get_regional_summary(df)
-            regional.to_excel(writer, sheet_name='Regional Summary', index=False)
-            
-            # Pathway progress
-            pathway = get_pathway_progress(df)
-            pathway.to_excel(writer, sheet_name='Pathway Progress')
-            
-            # Monthly trends
-            monthly = get_monthly_trends(df)
-            monthly.to_excel(writer, sheet_name='Monthly Trends', index=False)
-            
-            # KPIs
-            kpis = calculate_kpis(df)
-            kpi_df = pd.DataFrame(list(kpis.items()), columns=['Indicator', 'Value'])
-            kpi_df.to_excel(writer, sheet_name='KPIs', index=False)
+            # The four summary computations are independent reads of the
+            # same frame and release the GIL inside numpy/pandas; compute
+            # them concurrently while the raw sheet streams out, then write
+            # the results serially (Excel writers are not thread-safe).
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                regional_f = pool.submit(get_regional_summary, df)
+                pathway_f = pool.submit(get_pathway_progress, df)
+                monthly_f = pool.submit(get_monthly_trends, df)
+                kpis_f = pool.submit(calculate_kpis, df)
+
+                # Raw data
+                df.to_excel(writer, sheet_name='Raw Data', index=False)
+
+                # Regional summary
+                regional_f.result().to_excel(writer, sheet_name='Regional Summary', index=False)
+
+                # Pathway progress
+                pathway_f.result().to_excel(writer, sheet_name='Pathway Progress')
+
+                # Monthly trends
+                monthly_f.result().to_excel(writer, sheet_name='Monthly Trends', index=False)
+
+                # KPIs
+                kpi_df = pd.DataFrame(list(kpis_f.result().items()),
+                                      columns=['Indicator', 'Value'])
+                kpi_df.to_excel(writer, sheet_name='KPIs', index=False)
+        else:
+            # Raw data
+            df.to_excel(writer, sheet_name='Raw Data', index=False)